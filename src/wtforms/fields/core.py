@@ -1,7 +1,10 @@
 import datetime
 import decimal
+import functools
 import inspect
 import itertools
+import operator
+import re
 import warnings
 
 from markupsafe import escape
@@ -50,8 +53,13 @@ class Field:
     widget = None
     _formfield = True
     _translations = DummyTranslations()
+    _type = "Field"
     do_not_call_in_templates = True  # Allow Django 1.4 traversal
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._type = cls.__name__
+
     def __new__(cls, *args, **kwargs):
         if "_form" in kwargs:
             return super().__new__(cls)
@@ -134,7 +142,7 @@ class Field:
         self.flags = Flags()
         self.name = _prefix + name
         self.short_name = name
-        self.type = type(self).__name__
+        self.type = self._type
 
         self.check_validators(validators)
         self.validators = validators or self.validators
@@ -142,19 +150,18 @@ class Field:
         self.id = id or self.name
         self.label = Label(
             self.id,
-            label
-            if label is not None
-            else self.gettext(name.replace("_", " ").title()),
+            label if label is not None else self.gettext(_default_label(name)),
         )
 
         if widget is not None:
             self.widget = widget
 
+        flags = {}
         for v in itertools.chain(self.validators, [self.widget]):
-            flags = getattr(v, "field_flags", {})
+            field_flags = getattr(v, "field_flags", {})
 
             # check for legacy format, remove eventually
-            if isinstance(flags, tuple):  # pragma: no cover
+            if isinstance(field_flags, tuple):  # pragma: no cover
                 warnings.warn(
                     "Flags should be stored in dicts and not in tuples. "
                     "The next version of WTForms will abandon support "
@@ -162,10 +169,10 @@ class Field:
                     DeprecationWarning,
                     stacklevel=2,
                 )
-                flags = {flag_name: True for flag_name in flags}
+                field_flags = {flag_name: True for flag_name in field_flags}
 
-            for k, v in flags.items():
-                setattr(self.flags, k, v)
+            flags.update(field_flags)
+        self.flags.__dict__.update(flags)
 
     def __str__(self):
         """
@@ -264,7 +271,10 @@ class Field:
 
         # Run validators
         if not stop_validation:
-            chain = itertools.chain(self.validators, extra_validators)
+            if extra_validators:
+                chain = itertools.chain(self.validators, extra_validators)
+            else:
+                chain = self.validators
             stop_validation = self._run_validation_chain(form, chain)
 
         # Call post_validate
@@ -332,10 +342,12 @@ class Field:
         """
         self.process_errors = []
         if data is unset_value:
-            try:
-                data = self.default()
-            except TypeError:
-                data = self.default
+            data = self.default
+            if callable(data):
+                try:
+                    data = data()
+                except TypeError:
+                    pass
 
         self.object_data = data
 
@@ -355,8 +367,13 @@ class Field:
             except ValueError as e:
                 self.process_errors.append(e.args[0])
 
+        if not self.filters and not extra_filters:
+            return
+
         try:
-            for filter in itertools.chain(self.filters, extra_filters or []):
+            for filter in self.filters:
+                self.data = filter(self.data)
+            for filter in extra_filters or ():
                 self.data = filter(self.data)
         except ValueError as e:
             self.process_errors.append(e.args[0])
@@ -394,6 +411,17 @@ class Field:
         setattr(obj, name, self.data)
 
 
+@functools.lru_cache(maxsize=1024)
+def _default_label(name):
+    """
+    Build the untranslated label text for a field from its name.
+
+    The translation itself is not cached, since translations objects may
+    depend on the current request's locale.
+    """
+    return name.replace("_", " ").title()
+
+
 class UnboundField:
     _formfield = True
     creation_counter = 0
@@ -410,19 +438,20 @@ class UnboundField:
             self.field_class.check_validators(validators)
 
     def bind(self, form, name, prefix="", translations=None, **kwargs):
-        kw = dict(
-            self.kwargs,
-            name=name,
-            _form=form,
-            _prefix=prefix,
-            _translations=translations,
+        kw = {
+            **self.kwargs,
+            "name": name,
+            "_form": form,
+            "_prefix": prefix,
+            "_translations": translations,
             **kwargs,
-        )
+        }
         return self.field_class(*self.args, **kw)
 
     def __repr__(self):
-        return "<UnboundField({}, {!r}, {!r})>".format(
-            self.field_class.__name__, self.args, self.kwargs
+        return (
+            f"<UnboundField({self.field_class.__name__}, {self.args!r},"
+            f" {self.kwargs!r})>"
         )
 
 
@@ -435,14 +464,14 @@ class Flags:
 
     def __getattr__(self, name):
         if name.startswith("_"):
-            return super().__getattr__(name)
+            raise AttributeError(name)
         return None
 
     def __contains__(self, name):
-        return getattr(self, name)
+        return self.__dict__.get(name)
 
     def __repr__(self):
-        flags = (name for name in dir(self) if not name.startswith("_"))
+        flags = (name for name in sorted(self.__dict__) if not name.startswith("_"))
         return "<wtforms.fields.Flags: {%s}>" % ", ".join(flags)
 
 
@@ -454,6 +483,8 @@ class Label:
     def __init__(self, field_id, text):
         self.field_id = field_id
         self.text = text
+        self._cached_for = None
+        self._cached_html = None
 
     def __str__(self):
         return self()
@@ -462,6 +493,12 @@ class Label:
         return self()
 
     def __call__(self, text=None, **kwargs):
+        if not kwargs:
+            if text is None:
+                return self._default_html()
+            attributes = self._for_attribute()
+            return Markup(f"<label {attributes}>{escape(text or self.text)}</label>")
+
         if "for_" in kwargs:
             kwargs["for"] = kwargs.pop("for_")
         else:
@@ -471,10 +508,59 @@ class Label:
         text = escape(text or self.text)
         return Markup(f"<label {attributes}>{text}</label>")
 
+    def _default_html(self):
+        """
+        Render the label without any extra attributes, reusing the previous
+        rendering while ``field_id`` and ``text`` are unchanged.
+        """
+        field_id = self.field_id
+        text = self.text
+        cached = self._cached_html
+        if cached is not None and cached[0] is field_id and cached[1] is text:
+            return cached[2]
+
+        attributes = self._for_attribute()
+        html = Markup(f"<label {attributes}>{escape(text)}</label>")
+        # lazy strings may render differently each time, so only cache str
+        if isinstance(text, str):
+            self._cached_html = (field_id, text, html)
+        return html
+
+    def _for_attribute(self):
+        """
+        Return the rendered ``for`` attribute, computed once per ``field_id``.
+        """
+        field_id = self.field_id
+        cached = self._cached_for
+        if cached is None or cached[0] is not field_id:
+            cached = self._cached_for = (
+                field_id,
+                widgets.html_params(**{"for": field_id}),
+            )
+        return cached[1]
+
     def __repr__(self):
         return f"Label({self.field_id!r}, {self.text!r})"
 
 
+def _snapshot(items):
+    """
+    Copy a sequence for a later comparison with :func:`_same_items`.
+    """
+    return tuple(items) if items is not None else None
+
+
+def _same_items(snapshot, items):
+    """
+    Check whether a sequence still holds the same objects as a snapshot of it,
+    comparing by identity so values which are equal but of different types
+    aren't confused.
+    """
+    if snapshot is None or items is None:
+        return snapshot is items
+    return len(snapshot) == len(items) and all(map(operator.is_, snapshot, items))
+
+
 class SelectFieldBase(Field):
     option_widget = widgets.Option()
 
@@ -499,16 +585,23 @@ class SelectFieldBase(Field):
         raise NotImplementedError()
 
     def __iter__(self):
-        opts = dict(
-            widget=self.option_widget,
-            validators=self.validators,
-            name=self.name,
-            render_kw=self.render_kw,
-            _form=None,
-            _meta=self.meta,
-        )
+        option_class = self._Option
+        widget = self.option_widget
+        validators = self.validators
+        name = self.name
+        render_kw = self.render_kw
+        meta = self.meta
         for i, (value, label, checked) in enumerate(self.iter_choices()):
-            opt = self._Option(label=label, id="%s-%d" % (self.id, i), **opts)
+            opt = option_class(
+                label=label,
+                id=f"{self.id}-{i}",
+                widget=widget,
+                validators=validators,
+                name=name,
+                render_kw=render_kw,
+                _form=None,
+                _meta=meta,
+            )
             opt.process(None, value)
             opt.checked = checked
             yield opt
@@ -516,6 +609,11 @@ class SelectFieldBase(Field):
     class _Option(Field):
         checked = False
 
+        def __new__(cls, *args, **kwargs):
+            # Options are only ever constructed bound, skip the check for
+            # returning an UnboundField.
+            return object.__new__(cls)
+
         def _value(self):
             return str(self.data)
 
@@ -538,17 +636,55 @@ class SelectField(SelectFieldBase):
             choices = choices()
         self.choices = list(choices) if choices is not None else None
         self.validate_choice = validate_choice
+        self._coerced_cache = None
+        self._coerced_set = None
 
-    def iter_choices(self):
+    def _choice_pairs(self):
+        """
+        Return the choices as an iterable of ``(value, label)`` pairs, expanding
+        the shortcut form where each choice is only a value.
+        """
         if not self.choices:
-            choices = []
-        elif isinstance(self.choices[0], (list, tuple)):
-            choices = self.choices
-        else:
-            choices = zip(self.choices, self.choices)
+            return []
+        if isinstance(self.choices[0], (list, tuple)):
+            return self.choices
+        return zip(self.choices, self.choices)
 
-        for value, label in choices:
-            yield (value, label, self.coerce(value) == self.data)
+    def _coerced_choices(self):
+        """
+        Return the choice values passed through :attr:`coerce`, in order.
+
+        The result is reused until either ``choices`` or ``coerce`` change.
+        """
+        choices = self.choices
+        coerce = self.coerce
+        cache = self._coerced_cache
+        if cache is not None and cache[0] is coerce and _same_items(cache[1], choices):
+            return cache[2]
+
+        keys = [coerce(value) for value, _ in self._choice_pairs()]
+        self._coerced_cache = (coerce, _snapshot(choices), keys)
+        return keys
+
+    def _coerced_choice_set(self):
+        """
+        Return the coerced choice values as a frozenset, or as the list from
+        :meth:`_coerced_choices` if they aren't hashable.
+        """
+        keys = self._coerced_choices()
+        cached = self._coerced_set
+        if cached is None or cached[0] is not keys:
+            try:
+                choice_set = frozenset(keys)
+            except TypeError:
+                choice_set = keys
+            cached = self._coerced_set = (keys, choice_set)
+        return cached[1]
+
+    def iter_choices(self):
+        data = self.data
+        for (value, label), key in zip(self._choice_pairs(), self._coerced_choices()):
+            yield (value, label, key == data)
 
     def process_data(self, value):
         try:
@@ -573,10 +709,11 @@ class SelectField(SelectFieldBase):
         if not self.validate_choice:
             return
 
-        for _, _, match in self.iter_choices():
-            if match:
-                break
-        else:
+        try:
+            valid = self.data in self._coerced_choice_set()
+        except TypeError:
+            valid = self.data in self._coerced_choices()
+        if not valid:
             raise ValidationError(self.gettext("Not a valid choice."))
 
 
@@ -588,28 +725,37 @@ class SelectMultipleField(SelectField):
     """
 
     widget = widgets.Select(multiple=True)
+    _acceptable_cache = None
 
     def iter_choices(self):
-        if not self.choices:
-            choices = []
-        elif isinstance(self.choices[0], (list, tuple)):
-            choices = self.choices
-        else:
-            choices = zip(self.choices, self.choices)
+        data = self.data
+        if data is not None:
+            try:
+                data = frozenset(data)
+            except TypeError:
+                pass
 
-        for value, label in choices:
-            selected = self.data is not None and self.coerce(value) in self.data
+        for (value, label), key in zip(self._choice_pairs(), self._coerced_choices()):
+            if data is None:
+                selected = False
+            else:
+                try:
+                    selected = key in data
+                except TypeError:
+                    selected = key in self.data
             yield (value, label, selected)
 
     def process_data(self, value):
+        coerce = self.coerce
         try:
-            self.data = list(self.coerce(v) for v in value)
+            self.data = [coerce(v) for v in value]
         except (ValueError, TypeError):
             self.data = None
 
     def process_formdata(self, valuelist):
+        coerce = self.coerce
         try:
-            self.data = list(self.coerce(x) for x in valuelist)
+            self.data = [coerce(x) for x in valuelist]
         except ValueError:
             raise ValueError(
                 self.gettext(
@@ -624,8 +770,8 @@ class SelectMultipleField(SelectField):
         if not self.validate_choice or not self.data:
             return
 
-        acceptable = {c[0] for c in self.iter_choices()}
-        if any(d not in acceptable for d in self.data):
+        acceptable = self._acceptable_values()
+        if not acceptable.issuperset(self.data):
             unacceptable = [str(d) for d in set(self.data) - acceptable]
             raise ValidationError(
                 self.ngettext(
@@ -636,6 +782,17 @@ class SelectMultipleField(SelectField):
                 % dict(value="', '".join(unacceptable))
             )
 
+    def _acceptable_values(self):
+        """
+        Return the set of choice values, reused until ``choices`` change.
+        """
+        choices = self.choices
+        cached = self._acceptable_cache
+        if cached is None or not _same_items(cached[0], choices):
+            acceptable = frozenset(value for value, _ in self._choice_pairs())
+            cached = self._acceptable_cache = (_snapshot(choices), acceptable)
+        return cached[1]
+
 
 class RadioField(SelectField):
     """
@@ -776,6 +933,7 @@ class DecimalField(LocaleAwareNumberField):
             places = 2
         self.places = places
         self.rounding = rounding
+        self._quantize_exp = None
 
     def _value(self):
         if self.raw_data:
@@ -793,16 +951,28 @@ class DecimalField(LocaleAwareNumberField):
         if not hasattr(self.data, "quantize"):
             # If for some reason, data is a float or int, then format
             # as we would for floats using string formatting.
-            format = "%%0.%df" % self.places
-            return format % self.data
+            return f"{self.data:0.{self.places}f}"
 
-        exp = decimal.Decimal(".1") ** self.places
+        exp = self._quantize_exponent()
         if self.rounding is None:
             quantized = self.data.quantize(exp)
         else:
             quantized = self.data.quantize(exp, rounding=self.rounding)
         return str(quantized)
 
+    def _quantize_exponent(self):
+        """
+        Return the exponent to quantize data to, computed once per value of
+        ``places``.
+        """
+        cached = self._quantize_exp
+        if cached is None or cached[0] != self.places:
+            cached = self._quantize_exp = (
+                self.places,
+                decimal.Decimal(".1") ** self.places,
+            )
+        return cached[1]
+
     def process_formdata(self, valuelist):
         if not valuelist:
             return
@@ -854,17 +1024,17 @@ class BooleanField(Field):
 
     :param false_values:
         If provided, a sequence of strings each of which is an exact match
-        string of what is considered a "false" value. Defaults to the tuple
-        ``(False, "false", "")``
+        string of what is considered a "false" value. Defaults to
+        ``{False, "false", ""}``
     """
 
     widget = widgets.CheckboxInput()
-    false_values = (False, "false", "")
+    false_values = frozenset((False, "false", ""))
 
     def __init__(self, label=None, validators=None, false_values=None, **kwargs):
         super().__init__(label, validators, **kwargs)
         if false_values is not None:
-            self.false_values = false_values
+            self.false_values = frozenset(false_values)
 
     def process_data(self, value):
         self.data = bool(value)
@@ -881,6 +1051,41 @@ class BooleanField(Field):
         return "y"
 
 
+# Patterns matching exactly what strptime accepts for the default formats of the
+# date and time fields, so those can be parsed without going through strptime.
+_strptime_fast_paths = {
+    "%Y-%m-%d %H:%M:%S": re.compile(
+        r"(?P<year>\d{4})-(?P<month>\d\d)-(?P<day>\d\d)"
+        r" (?P<hour>\d\d):(?P<minute>\d\d):(?P<second>\d\d)",
+        re.ASCII,
+    ),
+    "%Y-%m-%d": re.compile(r"(?P<year>\d{4})-(?P<month>\d\d)-(?P<day>\d\d)", re.ASCII),
+    "%Y-%m": re.compile(r"(?P<year>\d{4})-(?P<month>\d\d)", re.ASCII),
+    "%H:%M": re.compile(r"(?P<hour>\d\d):(?P<minute>\d\d)", re.ASCII),
+}
+
+
+def _strptime(string, format):
+    """
+    Same as :meth:`datetime.datetime.strptime`, with a faster path for the
+    default formats of the date and time fields.
+    """
+    pattern = _strptime_fast_paths.get(format)
+    if pattern is not None:
+        match = pattern.fullmatch(string)
+        if match is not None:
+            parts = {"year": 1900, "month": 1, "day": 1}
+            for name, value in match.groupdict().items():
+                parts[name] = int(value)
+            try:
+                return datetime.datetime(**parts)
+            except ValueError:
+                # let strptime produce its own error
+                pass
+
+    return datetime.datetime.strptime(string, format)
+
+
 class DateTimeField(Field):
     """
     A text field which stores a `datetime.datetime` matching a format.
@@ -905,7 +1110,7 @@ class DateTimeField(Field):
 
         date_str = " ".join(valuelist)
         try:
-            self.data = datetime.datetime.strptime(date_str, self.format)
+            self.data = _strptime(date_str, self.format)
         except ValueError:
             self.data = None
             raise ValueError(self.gettext("Not a valid datetime value."))
@@ -927,7 +1132,7 @@ class DateField(DateTimeField):
 
         date_str = " ".join(valuelist)
         try:
-            self.data = datetime.datetime.strptime(date_str, self.format).date()
+            self.data = _strptime(date_str, self.format).date()
         except ValueError:
             self.data = None
             raise ValueError(self.gettext("Not a valid date value."))
@@ -949,7 +1154,7 @@ class TimeField(DateTimeField):
 
         time_str = " ".join(valuelist)
         try:
-            self.data = datetime.datetime.strptime(time_str, self.format).time()
+            self.data = _strptime(time_str, self.format).time()
         except ValueError:
             self.data = None
             raise ValueError(self.gettext("Not a valid time value."))
@@ -1006,10 +1211,12 @@ class FormField(Field):
             )
 
         if data is unset_value:
-            try:
-                data = self.default()
-            except TypeError:
-                data = self.default
+            data = self.default
+            if callable(data):
+                try:
+                    data = data()
+                except TypeError:
+                    pass
             self._obj = data
 
         self.object_data = data
@@ -1059,6 +1266,15 @@ class FormField(Field):
         return self.form.errors
 
 
+class _FakeObj:
+    """
+    Stand-in object used by :meth:`FieldList.populate_obj` to collect the
+    data each entry populates.
+    """
+
+    __slots__ = ("data",)
+
+
 class FieldList(Field):
     """
     Encapsulate an ordered list of multiple instances of the same field type,
@@ -1104,6 +1320,7 @@ class FieldList(Field):
         self.max_entries = max_entries
         self.last_index = -1
         self._prefix = kwargs.get("_prefix", "")
+        self._indices_re = None
 
     def process(self, formdata, data=unset_value, extra_filters=None):
         if extra_filters:
@@ -1112,28 +1329,32 @@ class FieldList(Field):
                 " them on the enclosed field."
             )
 
-        self.entries = []
         if data is unset_value or not data:
-            try:
-                data = self.default()
-            except TypeError:
-                data = self.default
+            data = self.default
+            if callable(data):
+                try:
+                    data = data()
+                except TypeError:
+                    pass
 
         self.object_data = data
 
+        if not formdata and not data and not self.min_entries:
+            self.entries = []
+            return
+
         if formdata:
-            indices = sorted(set(self._extract_indices(self.name, formdata)))
+            indices = self._extract_indices(self.name, formdata)
             if self.max_entries:
                 indices = indices[: self.max_entries]
 
             idata = iter(data)
-            for index in indices:
-                try:
-                    obj_data = next(idata)
-                except StopIteration:
-                    obj_data = unset_value
-                self._add_entry(formdata, obj_data, index=index)
+            items = [(index, next(idata, unset_value)) for index in indices]
+            self.entries = [None] * len(items)
+            for i, field in enumerate(self._create_entries(formdata, items)):
+                self.entries[i] = field
         else:
+            self.entries = []
             for obj_data in data:
                 self._add_entry(formdata, obj_data)
 
@@ -1142,18 +1363,33 @@ class FieldList(Field):
 
     def _extract_indices(self, prefix, formdata):
         """
-        Yield indices of any keys with given prefix.
+        Return the sorted, unique indices of any keys with given prefix.
 
         formdata must be an object which will produce keys when iterated.  For
         example, if field 'foo' contains keys 'foo-0-bar', 'foo-1-baz', then
-        the numbers 0 and 1 will be yielded, but not neccesarily in order.
+        ``[0, 1]`` will be returned.
+
+        Scanning every key can be avoided by formdata wrappers which already
+        index their keys: if formdata has a ``_wtforms_index`` method, it is
+        called with the prefix and must return an iterable of the indices of
+        the keys starting with ``<prefix>-<index>``, in any order.
         """
-        offset = len(prefix) + 1
+        index = getattr(formdata, "_wtforms_index", None)
+        if index is not None:
+            return sorted(set(index(prefix)))
+
+        cached = self._indices_re
+        if cached is None or cached[0] != prefix:
+            pattern = re.compile(re.escape(prefix) + r"-(\d+)(?:-|\Z)")
+            cached = self._indices_re = (prefix, pattern)
+        match = cached[1].match
+
+        seen = set()
         for k in formdata:
-            if k.startswith(prefix):
-                k = k[offset:].split("-", 1)[0]
-                if k.isdigit():
-                    yield int(k)
+            m = match(k)
+            if m is not None:
+                seen.add(int(m.group(1)))
+        return sorted(seen)
 
     def validate(self, form, extra_validators=()):
         """
@@ -1163,15 +1399,17 @@ class FieldList(Field):
         that FieldList validates all its enclosed fields first before running any
         of its own validators.
         """
-        self.errors = []
-
-        # Run validators on all entries within
-        for subfield in self.entries:
+        # Run validators on all entries within. The per-entry errors are only
+        # collected once an entry has errors, most of the time none do.
+        errors = None
+        for i, subfield in enumerate(self.entries):
             subfield.validate(form)
-            self.errors.append(subfield.errors)
+            if errors is not None:
+                errors.append(subfield.errors)
+            elif subfield.errors:
+                errors = [entry.errors for entry in self.entries[: i + 1]]
 
-        if not any(x for x in self.errors):
-            self.errors = []
+        self.errors = errors if errors is not None else []
 
         chain = itertools.chain(self.validators, extra_validators)
         self._run_validation_chain(form, chain)
@@ -1185,38 +1423,50 @@ class FieldList(Field):
         except TypeError:
             ivalues = iter([])
 
-        candidates = itertools.chain(ivalues, itertools.repeat(None))
-        _fake = type("_fake", (object,), {})
-        output = []
-        for field, data in zip(self.entries, candidates):
-            fake_obj = _fake()
-            fake_obj.data = data
+        output = [None] * len(self.entries)
+        for i, field in enumerate(self.entries):
+            fake_obj = _FakeObj()
+            fake_obj.data = next(ivalues, None)
             field.populate_obj(fake_obj, "data")
-            output.append(fake_obj.data)
+            output[i] = fake_obj.data
 
         setattr(obj, name, output)
 
     def _add_entry(self, formdata=None, data=unset_value, index=None):
-        assert (
-            not self.max_entries or len(self.entries) < self.max_entries
-        ), "You cannot have more than max_entries entries in this FieldList"
+        if self.max_entries and len(self.entries) >= self.max_entries:
+            raise AssertionError(
+                "You cannot have more than max_entries entries in this FieldList"
+            )
         if index is None:
             index = self.last_index + 1
-        self.last_index = index
-        name = "%s-%d" % (self.short_name, index)
-        id = "%s-%d" % (self.id, index)
-        field = self.unbound_field.bind(
-            form=None,
-            name=name,
-            prefix=self._prefix,
-            id=id,
-            _meta=self.meta,
-            translations=self._translations,
-        )
-        field.process(formdata, data)
+        (field,) = self._create_entries(formdata, [(index, data)])
         self.entries.append(field)
         return field
 
+    def _create_entries(self, formdata, items):
+        """
+        Bind and process a new entry for each ``(index, data)`` pair in
+        `items`, yielding them without adding them to :attr:`entries`.
+        """
+        bind = self.unbound_field.bind
+        name_prefix = f"{self.short_name}-"
+        id_prefix = f"{self.id}-"
+        prefix = self._prefix
+        meta = self.meta
+        translations = self._translations
+        for index, data in items:
+            self.last_index = index
+            field = bind(
+                form=None,
+                name=f"{name_prefix}{index}",
+                prefix=prefix,
+                id=f"{id_prefix}{index}",
+                _meta=meta,
+                translations=translations,
+            )
+            field.process(formdata, data)
+            yield field
+
     def append_entry(self, data=unset_value):
         """
         Create a new entry with optional default data.
@@ -108,14 +108,14 @@ class BaseForm:
         if data is not None:
             kwargs = dict(data, **kwargs)
 
-        filters = extra_filters.copy() if extra_filters is not None else {}
+        filters = extra_filters if extra_filters is not None else {}
 
         for name, field in self._fields.items():
-            field_extra_filters = filters.get(name, [])
+            field_extra_filters = filters.get(name)
 
             inline_filter = getattr(self, "filter_%s" % name, None)
             if inline_filter is not None:
-                field_extra_filters.append(inline_filter)
+                field_extra_filters = [*(field_extra_filters or ()), inline_filter]
 
             if obj is not None and hasattr(obj, name):
                 data = getattr(obj, name)
@@ -142,7 +142,7 @@ class BaseForm:
             if extra_validators is not None and name in extra_validators:
                 extra = extra_validators[name]
             else:
-                extra = tuple()
+                extra = ()
             if not field.validate(self, extra):
                 success = False
         return success
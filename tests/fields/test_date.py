@@ -27,3 +27,12 @@ def test_failure():
     assert len(form.a.errors) == 1
     assert len(form.b.errors) == 1
     assert form.a.process_errors[0] == "Not a valid date value."
+
+
+def test_lenient_and_invalid_values():
+    form = F(DummyPostData(a=["2008-5-7"]))
+    assert form.a.data == date(2008, 5, 7)
+
+    form = F(DummyPostData(a=["2008-02-30"]))
+    assert form.a.data is None
+    assert form.a.process_errors == ["Not a valid date value."]
@@ -37,6 +37,8 @@ def test_quantize():
     assert form.a._value() == "3.142"
     form.a.rounding = ROUND_DOWN
     assert form.a._value() == "3.141"
+    form.a.places = 1
+    assert form.a._value() == "3.1"
     assert form.b._value() == ""
     form = F(a=3.14159265, b=72)
     assert form.a._value() == "3.142"
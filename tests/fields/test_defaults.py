@@ -17,6 +17,17 @@ def test_defaults():
     test_callable.process(None)
     assert test_callable.data == expected
 
+    test_callable.default = "changed"
+    test_callable.process(None)
+    assert test_callable.data == "changed"
+
+    def needs_argument(value):
+        return value
+
+    test_argument = StringField(default=needs_argument).bind(Form(), "a")
+    test_argument.process(None)
+    assert test_argument.data is needs_argument
+
 
 def test_unset_value():
     assert str(unset_value) == "<unset value>"
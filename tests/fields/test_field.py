@@ -213,3 +213,21 @@ def test_post():
     assert a.errors == ["Post"]
     stopped = _init_field("stop-post")
     assert stopped.errors == ["stop with message", "Post-stopped"]
+
+
+def test_validation_chain_continues_after_error():
+    def fail(message):
+        def validator(form, field):
+            raise validators.ValidationError(message)
+
+        return validator
+
+    def stop(form, field):
+        raise validators.StopValidation("stop")
+
+    class F(Form):
+        a = StringField(validators=[fail("one"), fail("two"), stop, fail("three")])
+
+    form = F()
+    assert form.validate() is False
+    assert form.a.errors == ["one", "two", "stop"]
@@ -56,3 +56,16 @@ def test_inline():
     assert "hello" == form.a.data
     assert -42 == form.b.data
     assert form.validate()
+
+
+def test_extra_and_inline():
+    class F(Form):
+        a = StringField(default=" hello ")
+
+        def filter_a(self, value):
+            return value + "!"
+
+    extra_filters = {"a": [str.strip]}
+    form = F(extra_filters=extra_filters)
+    assert form.a.data == "hello!"
+    assert extra_filters == {"a": [str.strip]}
@@ -39,3 +39,21 @@ def test_underscore_property(flags):
         flags._foo
     flags._foo = 42
     assert flags._foo == 42
+
+
+def test_flags_not_shared_between_fields():
+    class F(Form):
+        a = StringField(validators=[validators.DataRequired()])
+
+    first, second = F(), F()
+    first.a.flags.required = False
+    assert second.a.flags.required is True
+
+
+def test_field_flags_changed_after_bind():
+    validator = validators.Length(max=5)
+    StringField(validators=[validator]).bind(Form(), "a")
+    validator.field_flags = dict(validator.field_flags, foo=True)
+    flags = StringField(validators=[validator]).bind(Form(), "a").flags
+    assert flags.maxlength == 5
+    assert flags.foo is True
@@ -126,3 +126,19 @@ def test_populate_property(F1):
     obj2 = ClassWithProperty()
     form.populate_obj(obj2)
     assert obj1.a_ == {"a": "new_a", "b": "new_b"}
+
+
+def test_attribute_access_after_process(F1):
+    form = F1(DummyPostData({"a-a": ["moo"]}))
+    assert form.a.a is form.a.form.a
+    assert form.a.a.data == "moo"
+    form.process(DummyPostData({"a-a": ["baa"]}))
+    assert form.a.a is form.a.form.a
+    assert form.a.a.data == "baa"
+
+
+def test_attribute_access_after_delete(F1):
+    form = F1()
+    assert form.a.a is form.a.form.a
+    del form.a.form.a
+    assert form.a.a is None
@@ -41,3 +41,13 @@ def test_escaped_label_text():
         '<label for="bar">&lt;script&gt;'
         "alert(&#34;test&#34;);&lt;/script&gt;</label>"
     )
+
+
+def test_label_changed_after_render():
+    label = Label("test", "Caption")
+    assert label() == """<label for="test">Caption</label>"""
+    label.text = "Other"
+    assert label() == """<label for="test">Other</label>"""
+    label.field_id = "other"
+    assert label() == """<label for="other">Other</label>"""
+    assert label("Custom") == """<label for="other">Custom</label>"""
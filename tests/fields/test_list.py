@@ -185,3 +185,45 @@ def test_errors():
     form = F(DummyPostData({"a-0": ["a"], "a-1": ""}))
     assert not form.validate()
     assert form.a.errors == [[], ["This field is required."]]
+
+
+def test_overlapping_names():
+    F = make_form(a=FieldList(StringField()), ab=FieldList(StringField()))
+    form = F(DummyPostData({"a-0": ["x"], "ab-1": ["y"], "ax5": ["z"], "a-1\n": ["w"]}))
+    assert form.a.data == ["x"]
+    assert form.ab.data == ["y"]
+
+
+def test_enclosed_subform_errors():
+    F = make_form(a=FieldList(FormField(make_form("FChild", a=t))))
+    form = F(DummyPostData({"a-0-a": ["x"], "a-1-a": [""], "a-2-a": ["y"]}))
+    assert not form.validate()
+    assert form.a.errors == [{}, {"a": ["This field is required."]}, {}]
+
+    form = F(DummyPostData({"a-0-a": ["x"]}))
+    assert form.validate()
+    assert form.a.errors == []
+
+
+def test_formdata_index():
+    class IndexedPostData(DummyPostData):
+        def __iter__(self):
+            raise AssertionError("keys should not be scanned")
+
+        def _wtforms_index(self, prefix):
+            assert prefix == "a"
+            return [2, 0, 2]
+
+    F = make_form(a=FieldList(StringField()))
+    form = F(IndexedPostData({"a-0": ["x"], "a-2": ["y"]}))
+    assert form.a.data == ["x", "y"]
+    assert [entry.name for entry in form.a] == ["a-0", "a-2"]
+
+
+def test_append_entry_after_id_change():
+    F = make_form(a=FieldList(StringField()))
+    form = F()
+    form.a.id = "other"
+    entry = form.a.append_entry()
+    assert entry.id == "other-0"
+    assert entry.name == "a-0"
@@ -208,3 +208,24 @@ def test_render_kw_preserved():
         '<option value="bar">bar</option>'
         "</select>"
     )
+
+
+def test_choices_changed_after_validation():
+    F = make_form(a=SelectField(choices=[("a", "hello")]))
+    form = F(DummyPostData(a="b"))
+    assert form.validate() is False
+    form.a.choices.append(("b", "bye"))
+    assert form.validate()
+    assert list(form.a.iter_choices()) == [("a", "hello", False), ("b", "bye", True)]
+
+    form.a.coerce = str.upper
+    assert list(form.a.iter_choices()) == [("a", "hello", False), ("b", "bye", False)]
+
+
+def test_choices_replaced_with_equal_values():
+    F = make_form(a=SelectField(choices=[(1, "one")]))
+    form = F(DummyPostData(a="1"))
+    assert list(form.a.iter_choices()) == [(1, "one", True)]
+    form.a.choices = [(True, "one")]
+    assert list(form.a.iter_choices()) == [(True, "one", False)]
+    assert form.validate() is False
@@ -149,3 +149,46 @@ def test_render_kw_preserved():
         '<option value="bar">bar</option>'
         "</select>"
     )
+
+
+def test_unhashable_data():
+    F = make_form(a=SelectMultipleField(choices=["ab", "cd"], coerce=list))
+    form = F(DummyPostData(a=["cd"]))
+    assert form.a.data == [["c", "d"]]
+    assert list(form.a.iter_choices()) == [("ab", "ab", False), ("cd", "cd", True)]
+    form = F(DummyPostData(a=[]))
+    assert form.a.data == []
+    assert list(form.a.iter_choices()) == [("ab", "ab", False), ("cd", "cd", False)]
+    assert "selected" not in form.a()
+
+
+def test_choices_changed_after_validation():
+    F = make_form(a=SelectMultipleField(choices=["a"]))
+    form = F(DummyPostData(a=["a", "b"]))
+    assert form.validate() is False
+    form.a.choices.append("b")
+    assert form.validate()
+
+
+class Code:
+    """Matches its own value, but compares equal to every other Code."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        if isinstance(other, Code):
+            return True
+        return self.value == other
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+def test_choices_replaced_with_equal_values():
+    F = make_form(a=SelectMultipleField(choices=[(Code("a"), "Code")]))
+    form = F(DummyPostData(a=["a"]))
+    assert form.validate()
+    form.a.choices = [(Code("b"), "Code")]
+    assert form.validate() is False
+    assert form.a.errors == ["'a' is not a valid choice for this field."]